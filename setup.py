@@ -0,0 +1,32 @@
+"""Optional build step that compiles AP2's hot modules with Cython.
+
+All package metadata lives in pyproject.toml and, by default, the package is
+built as pure Python. Set AP2_CYTHONIZE=1 with Cython installed to also compile
+the modules listed below into extension modules. The .py sources are always
+shipped, so the pure-Python modules remain the fallback wherever the compiled
+ones are unavailable. ap2.types.COMPILED reports whether the compiled type
+models were imported.
+"""
+
+import os
+
+from setuptools import Extension
+from setuptools import setup
+
+# Modules compiled when AP2_CYTHONIZE=1, as (module name, source path).
+_COMPILED_MODULES = [
+    ("ap2.types.payment_request", "src/ap2/types/payment_request.py"),
+    ("ap2.types.contact_picker", "src/ap2/types/contact_picker.py"),
+    ("ap2.common.watch_log", "src/ap2/common/watch_log.py"),
+]
+
+ext_modules = []
+if os.environ.get("AP2_CYTHONIZE") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [Extension(name, [path]) for name, path in _COMPILED_MODULES],
+        compiler_directives={"language_level": 3},
+    )
+
+setup(ext_modules=ext_modules)
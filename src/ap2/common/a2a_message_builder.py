@@ -1,9 +1,28 @@
 """A builder class for building an A2A Message object."""
 
+import os
+import secrets
 from typing import Any, Self
-import uuid
 
 from a2a import types as a2a_types
+from pydantic import BaseModel
+
+
+# The builder fully controls the fields of the objects it creates, so they are
+# built without validation. The one exception is DataPart data, which comes
+# from the caller and is validated unless it is a dict. Set
+# AP2_STRICT_VALIDATE=1 (e.g. in tests) to validate everything anyway.
+_STRICT_VALIDATE = os.environ.get("AP2_STRICT_VALIDATE", "").lower() in (
+    "1",
+    "true",
+)
+
+
+def _build(model: type[BaseModel], **kwargs: Any) -> Any:
+    """Creates a model instance, validating it only in strict mode."""
+    if _STRICT_VALIDATE:
+        return model(**kwargs)
+    return model.model_construct(**kwargs)
 
 
 class A2aMessageBuilder:
@@ -21,7 +40,7 @@ class A2aMessageBuilder:
         Returns:
           The A2aMessageBuilder instance.
         """
-        part = a2a_types.Part(root=a2a_types.TextPart(text=text))
+        part = _build(a2a_types.Part, root=_build(a2a_types.TextPart, text=text))
         self._message.parts.append(part)
         return self
 
@@ -42,15 +61,25 @@ class A2aMessageBuilder:
         Returns:
           The A2aMessageBuilder instance.
         """
-        if not data:
-            return self
+        if data:
+            self._message.parts.append(self._create_data_part(key, data))
+        return self
 
-        nested_data = data
-        if key:
-            nested_data = {key: data}
+    def add_data_bulk(self, items: list[tuple[str, str | dict[str, Any]]]) -> Self:
+        """Adds a DataPart to the Message for each (key, data) pair.
 
-        part = a2a_types.Part(root=a2a_types.DataPart(data=nested_data))
-        self._message.parts.append(part)
+        Each pair is handled as in add_data, but the parts are appended to the
+        Message in a single operation.
+
+        Args:
+          items: The (key, data) pairs to be added, in order.
+
+        Returns:
+          The A2aMessageBuilder instance.
+        """
+        self._message.parts.extend(
+            self._create_data_part(key, data) for key, data in items if data
+        )
         return self
 
     def set_context_id(self, context_id: str) -> Self:
@@ -67,10 +96,24 @@ class A2aMessageBuilder:
         """Returns the Message object that has been built."""
         return self._message
 
+    def _create_data_part(
+        self, key: str, data: str | dict[str, Any]
+    ) -> a2a_types.Part:
+        """Creates a Part wrapping a DataPart for the given key and data."""
+        nested_data = {key: data} if key else data
+        if isinstance(nested_data, dict):
+            data_part = _build(a2a_types.DataPart, data=nested_data)
+        else:
+            # The data comes from the caller, so anything but a dict is validated
+            # and rejected with a ValidationError.
+            data_part = a2a_types.DataPart(data=nested_data)
+        return _build(a2a_types.Part, root=data_part)
+
     def _create_base_message(self) -> a2a_types.Message:
         """Creates and returns a base Message object."""
-        return a2a_types.Message(
-            message_id=uuid.uuid4().hex,
+        return _build(
+            a2a_types.Message,
+            message_id=secrets.token_hex(16),
             parts=[],
             role=a2a_types.Role.agent,
         )
@@ -1,17 +1,26 @@
 """Helper functions for working with A2A Artifact objects."""
 
+import functools
+import itertools
 from typing import Any, TypeVar
 
 from a2a.types import Artifact
 from a2a.utils import message as message_utils
 from pydantic import BaseModel
 
+from ap2.types._construct import construct_canonical_object
+from ap2.types._construct import get_validator
+
 
 T = TypeVar("T")
 
 
 def find_canonical_objects(
-    artifacts: list[Artifact], data_key: str, model: BaseModel
+    artifacts: list[Artifact],
+    data_key: str,
+    model: BaseModel,
+    *,
+    trusted: bool = False,
 ) -> list[BaseModel]:
     """Finds all canonical objects of the given type in the artifacts.
 
@@ -19,16 +28,25 @@ def find_canonical_objects(
       artifacts: a list of the artifacts to be searched.
       data_key: The key of the DataPart to search for.
       model: The model of the canonical object to search for.
+      trusted: If True, the artifacts are assumed to hold already-validated
+        objects and they are built without running validation.
 
     Returns:
       A list of canonical objects of the given type in the artifacts.
     """
-    canonical_objects = []
-    for artifact in artifacts:
-        for part in artifact.parts:
-            if hasattr(part.root, "data") and data_key in part.root.data:
-                canonical_objects.append(model.model_validate(part.root.data[data_key]))
-    return canonical_objects
+    if trusted:
+        convert = functools.partial(construct_canonical_object, model)
+    else:
+        convert = get_validator(model).validate_python
+    parts = itertools.chain.from_iterable(
+        artifact.parts for artifact in artifacts
+    )
+    data_parts = message_utils.get_data_parts(list(parts))
+    return [
+        convert(data_part[data_key])
+        for data_part in data_parts
+        if data_key in data_part
+    ]
 
 
 def get_first_data_part(artifacts: list[Artifact]) -> dict[str, Any]:
@@ -40,12 +58,12 @@ def get_first_data_part(artifacts: list[Artifact]) -> dict[str, Any]:
     Returns:
       The data contents within the first found DataPart.
     """
-    data_parts = [
-        message_utils.get_data_parts(artifact.parts) for artifact in artifacts
-    ]
-    for data_part in data_parts:
-        for item in data_part:
-            return item
+    for artifact in artifacts:
+        if not artifact.parts:
+            continue
+        data_parts = message_utils.get_data_parts(artifact.parts)
+        if data_parts:
+            return data_parts[0]
     return {}
 
 
@@ -58,10 +76,10 @@ def only(list_: list[T]) -> T:
     Raises:
       ValueError: if the list is empty or has more than one element.
     """
-    if not list_:
-        raise ValueError("List is empty.")
-    if len(list_) > 1:
-        raise ValueError("List has more than one element.")
-    return list_[0]
-
-
+    try:
+        (item,) = list_
+    except ValueError:
+        if not list_:
+            raise ValueError("List is empty.") from None
+        raise ValueError("List has more than one element.") from None
+    return item
@@ -10,9 +10,10 @@ This provides some custom abilities over the default AgentExecutor:
 """
 
 import abc
+import asyncio
 import logging
+import secrets
 from typing import Any, Callable, Tuple
-import uuid
 
 from a2a.server.agent_execution.agent_executor import AgentExecutor
 from a2a.server.agent_execution.context import RequestContext
@@ -52,12 +53,14 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
           tools: Tools supported by the agent.
           system_prompt: Helps steer the model when choosing tools.
         """
-        if supported_extensions is not None:
-            self._supported_extension_uris = {ext.uri for ext in supported_extensions}
-        else:
-            self._supported_extension_uris = set()
+        self._supported_extension_uris = frozenset(
+            ext.uri for ext in supported_extensions or ()
+        )
         self._client = genai.Client()
         self._tools = tools
+        self._tool_by_name = {tool.__name__: tool for tool in tools}
+        if len(self._tool_by_name) != len(tools):
+            raise ValueError("Tool names must be unique.")
         self._tool_resolver = FunctionCallResolver(
             self._client, self._tools, system_prompt
         )
@@ -84,8 +87,13 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
                 PAYMENT_MANDATE_DATA_KEY, data_parts
             )
             if payment_mandate is not None:
-                validate_payment_mandate_signature(
-                    PaymentMandate.model_validate(payment_mandate)
+                # Inbound mandates are untrusted, so they are always fully
+                # validated before their signature is checked. Signature
+                # verification runs in a worker thread to keep the event loop
+                # free for other requests.
+                await asyncio.to_thread(
+                    validate_payment_mandate_signature,
+                    PaymentMandate.model_validate(payment_mandate),
                 )
         else:
             raise ValueError(
@@ -95,8 +103,8 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
 
         updater = TaskUpdater(
             event_queue,
-            task_id=context.task_id or str(uuid.uuid4()),
-            context_id=context.context_id or str(uuid.uuid4()),
+            task_id=context.task_id or secrets.token_hex(16),
+            context_id=context.context_id or secrets.token_hex(16),
         )
 
         logging.info(
@@ -135,14 +143,9 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
             tool_name = self._tool_resolver.determine_tool_to_use(prompt)
             logging.info("Using tool: %s", tool_name)
 
-            matching_tools = list(
-                filter(lambda tool: tool.__name__ == tool_name, self._tools)
-            )
-            if len(matching_tools) != 1:
-                raise ValueError(
-                    f"Expected 1 tool matching {tool_name}, got {len(matching_tools)}"
-                )
-            callable_tool = matching_tools[0]
+            callable_tool = self._tool_by_name.get(tool_name)
+            if callable_tool is None:
+                raise ValueError(f"Expected 1 tool matching {tool_name}, got 0")
             await callable_tool(data_parts, updater, current_task)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -173,9 +176,8 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
         Args:
           context: The A2A RequestContext
         """
-        requested_uris = context.requested_extensions
-        activated_uris = requested_uris.intersection(self._supported_extension_uris)
-        for uri in activated_uris:
-            context.add_activated_extension(uri)
+        for uri in context.requested_extensions:
+            if uri in self._supported_extension_uris:
+                context.add_activated_extension(uri)
 
 
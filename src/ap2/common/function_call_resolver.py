@@ -12,6 +12,12 @@ from google.genai import types
 DataPartContent = dict[str, Any]
 Tool = Callable[[list[DataPartContent], TaskUpdater, Task | None], Any]
 
+# The model used to resolve prompts to tools.
+_MODEL = "gemini-2.5-flash"
+
+# The maximum number of prompt -> tool decisions remembered per resolver.
+_DECISION_CACHE_SIZE = 1024
+
 
 class FunctionCallResolver:
     """Resolves a natural language prompt to the name of a tool."""
@@ -30,12 +36,16 @@ class FunctionCallResolver:
           instructions: The instructions to guide the LLM.
         """
         self._client = llm_client
+        self._decision_cache: dict[str, str] = {}
         function_declarations = [
             types.FunctionDeclaration(
                 name=tool.__name__, description=tool.__doc__
             )
             for tool in tools
         ]
+        # Built once and always passed as a model instance: the SDK uses an
+        # already-built GenerateContentConfig as-is, whereas a dict config would
+        # be re-validated into one on every call.
         self._config = types.GenerateContentConfig(
             system_instruction=instructions,
             tools=[types.Tool(function_declarations=function_declarations)],
@@ -54,6 +64,11 @@ class FunctionCallResolver:
         Uses a LLM to analyze the user's prompt and decide which of the available
         tools (functions) is the most appropriate to handle the request.
 
+        Decisions are cached per resolver, keyed on the prompt with case and
+        whitespace normalized, so repeated prompts skip the LLM round-trip. The
+        least recently used decision is evicted once the cache is full, and
+        "Unknown" results are not cached.
+
         Args:
           prompt: The user's request as a string.
 
@@ -61,9 +76,30 @@ class FunctionCallResolver:
           The name of the tool function that the model has determined should be
           called. If no suitable tool is found, it returns "Unknown".
         """
-
+        key = " ".join(prompt.lower().split())
+        tool_name = self._decision_cache.pop(key, None)
+        if tool_name is not None:
+            # Re-inserted to mark it as the most recently used decision.
+            self._decision_cache[key] = tool_name
+            return tool_name
+
+        tool_name = self._ask_model(prompt)
+        if tool_name != "Unknown":
+            if len(self._decision_cache) >= _DECISION_CACHE_SIZE:
+                # Evict the least recently used decision; dicts preserve
+                # insertion order and hits are re-inserted.
+                del self._decision_cache[next(iter(self._decision_cache))]
+            self._decision_cache[key] = tool_name
+        return tool_name
+
+    def clear_cache(self) -> None:
+        """Forgets all previously resolved prompts."""
+        self._decision_cache.clear()
+
+    def _ask_model(self, prompt: str) -> str:
+        """Asks the LLM which tool to use for the prompt."""
         response = self._client.models.generate_content(
-            model="gemini-2.5-flash",
+            model=_MODEL,
             contents=prompt,
             config=self._config,
         )
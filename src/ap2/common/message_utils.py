@@ -1,9 +1,16 @@
 """Helper functions for working with A2A Message objects."""
 
+import json
 from typing import Any
 
 from pydantic import BaseModel
 
+from ap2.types._construct import construct_canonical_object
+from ap2.types._construct import get_validator
+
+# Distinguishes a missing key from a key whose value is None.
+_MISSING = object()
+
 
 def find_data_part(
     data_key: str, data_parts: list[dict[str, Any]]
@@ -18,8 +25,9 @@ def find_data_part(
       The value for the first occurrence of the key in the data parts, or None.
     """
     for data_part in data_parts:
-        if data_key in data_part:
-            return data_part[data_key]
+        value = data_part.get(data_key, _MISSING)
+        if value is not _MISSING:
+            return value
 
     return None
 
@@ -36,25 +44,30 @@ def find_data_parts(
     Returns:
       A list of all values for the given key in the data parts.
     """
-    data_parts_with_key = []
-    for data_part in data_parts:
-        if data_key in data_part:
-            data_parts_with_key.append(data_part[data_key])
-
-    return data_parts_with_key
+    return [
+        data_part[data_key] for data_part in data_parts if data_key in data_part
+    ]
 
 
 def parse_canonical_object(
     data_key: str,
     data_parts: list[dict[str, Any]],
     canonical_object_model: BaseModel,
+    *,
+    trusted: bool = False,
 ) -> Any:
     """Converts the data part value for the given key to a canonical object.
 
+    The data part value may be either the decoded object or its JSON encoding;
+    JSON strings are parsed and validated in a single pass.
+
     Args:
       data_key: The key to search for.
       data_parts: The data parts to be searched.
       canonical_object_model: The pydantic model of the canonical object.
+      trusted: If True, the value is assumed to have been validated already
+        (e.g. it was produced by one of our own agents) and the object is built
+        without running validation. See construct_canonical_object.
 
     Returns:
       The canonical object created from the data part value.
@@ -62,6 +75,13 @@ def parse_canonical_object(
     canonical_object_data = find_data_part(data_key, data_parts)
     if canonical_object_data is None:
         raise ValueError(f'{type(canonical_object_model)} not found.')
-    return canonical_object_model.model_validate(canonical_object_data)
-
-
+    if trusted:
+        if isinstance(canonical_object_data, (bytes, bytearray, str)):
+            canonical_object_data = json.loads(canonical_object_data)
+        return construct_canonical_object(
+            canonical_object_model, canonical_object_data
+        )
+    validator = get_validator(canonical_object_model)
+    if isinstance(canonical_object_data, (bytes, bytearray, str)):
+        return validator.validate_json(canonical_object_data)
+    return validator.validate_python(canonical_object_data)
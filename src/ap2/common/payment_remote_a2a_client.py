@@ -1,8 +1,11 @@
 """Wrapper for the A2A client."""
 
+import asyncio
+import importlib.util
 import httpx
 import logging
-import uuid
+import secrets
+import weakref
 
 from a2a import types as a2a_types
 from a2a.client.card_resolver import A2ACardResolver
@@ -10,11 +13,72 @@ from a2a.client.client import Client
 from a2a.client.client import ClientConfig
 from a2a.client.client_factory import ClientFactory
 from a2a.client.client_task_manager import ClientTaskManager
+from a2a.client.middleware import ClientCallContext
 from a2a.extensions.common import HTTP_EXTENSION_HEADER
 
 
 DEFAULT_TIMEOUT = 600.0
 
+# The httpx client shared by all PaymentRemoteA2aClients, per event loop: a
+# connection pool can only be used from the loop that created it.
+_SHARED_HTTPX: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+# AgentCards resolved so far, shared by all clients and keyed by base URL.
+_CARD_CACHE: dict[str, a2a_types.AgentCard] = {}
+
+# The locks serializing card fetches, per event loop and base URL.
+_CARD_LOCKS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Lock]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Returns the httpx client shared by all clients on the running loop.
+
+    Sharing one client lets every remote agent reuse the same connection pool,
+    and HTTP/2 (when the optional h2 package is installed) lets requests to the
+    same host multiplex over a single connection. Each event loop gets its own
+    client, so callers that run several loops (e.g. successive asyncio.run
+    calls) keep working.
+    """
+    loop = asyncio.get_running_loop()
+    client = _SHARED_HTTPX.get(loop)
+    if client is None:
+        _forget_closed_loops(_SHARED_HTTPX)
+        client = _SHARED_HTTPX[loop] = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=httpx.Timeout(timeout=DEFAULT_TIMEOUT),
+            limits=httpx.Limits(
+                max_keepalive_connections=64, max_connections=128
+            ),
+        )
+    return client
+
+
+def _get_card_lock(base_url: str) -> asyncio.Lock:
+    """Returns the lock for fetching the card of base_url on the running loop."""
+    loop = asyncio.get_running_loop()
+    locks = _CARD_LOCKS.get(loop)
+    if locks is None:
+        _forget_closed_loops(_CARD_LOCKS)
+        locks = _CARD_LOCKS[loop] = {}
+    lock = locks.get(base_url)
+    if lock is None:
+        lock = locks[base_url] = asyncio.Lock()
+    return lock
+
+
+def _forget_closed_loops(per_loop: weakref.WeakKeyDictionary) -> None:
+    """Drops the entries of event loops that have been closed.
+
+    Loops are usually dropped once they are garbage collected, but objects
+    left in the entries may still refer to their loop and keep it alive.
+    """
+    for loop in [loop for loop in per_loop if loop.is_closed()]:
+        del per_loop[loop]
+
 
 class PaymentRemoteA2aClient():
     """Wrapper for the A2A client.
@@ -38,29 +102,48 @@ class PaymentRemoteA2aClient():
           required_extensions: A set of extension URIs that the client requires.
         """
 
-        self._httpx_client = httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout=DEFAULT_TIMEOUT)
-        )
-        self._a2a_client_factory = ClientFactory(
-            ClientConfig(
-                httpx_client=self._httpx_client,
-            )
-        )
         self._name = name
         self._base_url = base_url
         self._agent_card = None
+        self._client_instance: Client | None = None
+        self._client_lock: asyncio.Lock | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
         self._client_required_extensions = required_extensions or set()
+        self._ext_header_value = ", ".join(
+            sorted(self._client_required_extensions)
+        )
 
     async def get_agent_card(self) -> a2a_types.AgentCard:
-        """Get agent card."""
+        """Get agent card.
+
+        The card is fetched once per base URL and shared with every other
+        client of the same remote agent.
+        """
         if self._agent_card is None:
-            resolver = A2ACardResolver(
-                httpx_client=self._httpx_client,
-                base_url=self._base_url,
-            )
-            self._agent_card = await resolver.get_agent_card()
+            async with _get_card_lock(self._base_url):
+                agent_card = _CARD_CACHE.get(self._base_url)
+                if agent_card is None:
+                    resolver = A2ACardResolver(
+                        httpx_client=_get_shared_client(),
+                        base_url=self._base_url,
+                    )
+                    agent_card = await resolver.get_agent_card()
+                    _CARD_CACHE[self._base_url] = agent_card
+            self._agent_card = agent_card
         return self._agent_card
 
+    @staticmethod
+    def invalidate_card_cache(base_url: str) -> None:
+        """Forgets the shared AgentCard for the given base URL.
+
+        Clients created afterwards fetch the card again. Existing clients keep
+        the card they have already resolved.
+
+        Args:
+          base_url: The base URL where the remote agent is hosted.
+        """
+        _CARD_CACHE.pop(base_url, None)
+
     async def send_a2a_message(
         self, message: a2a_types.Message
     ) -> a2a_types.Task:
@@ -69,7 +152,9 @@ class PaymentRemoteA2aClient():
 
         task_manager = ClientTaskManager()
 
-        async for event in my_a2a_client.send_message(message):
+        async for event in my_a2a_client.send_message(
+            message, context=self._create_call_context()
+        ):
             # Tasks are returned in tuples (aka ClientEvent). The first element is the
             # Task, the second element is the UpdateEvent.
             if isinstance(event, tuple):
@@ -88,12 +173,39 @@ class PaymentRemoteA2aClient():
         return task
 
     async def _get_a2a_client(self) -> Client:
-        """Get A2A client."""
-        agent_card = await self.get_agent_card()
-        self._httpx_client.headers[HTTP_EXTENSION_HEADER] = ", ".join(
-            self._client_required_extensions
+        """Get A2A client, creating it on first use on each event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            # The client uses the running loop's shared httpx client, so one
+            # created on a previous loop cannot be reused.
+            self._client_loop = loop
+            self._client_lock = asyncio.Lock()
+            self._client_instance = None
+        async with self._client_lock:
+            if self._client_instance is None:
+                factory = ClientFactory(
+                    ClientConfig(httpx_client=_get_shared_client())
+                )
+                self._client_instance = factory.create(
+                    await self.get_agent_card()
+                )
+        return self._client_instance
+
+    def _create_call_context(self) -> ClientCallContext:
+        """Creates the per-request context carrying the extension header.
+
+        The httpx client is shared across agents and concurrent requests, so the
+        header is attached to each request instead of being set on the client.
+        A fresh context is built per call because the transport may add to its
+        headers.
+        """
+        return ClientCallContext(
+            state={
+                "http_kwargs": {
+                    "headers": {HTTP_EXTENSION_HEADER: self._ext_header_value}
+                }
+            }
         )
-        return self._a2a_client_factory.create(agent_card)
 
     def _create_agent_message(
         self,
@@ -101,7 +213,7 @@ class PaymentRemoteA2aClient():
     ) -> a2a_types.Message:
         """Get message."""
         return a2a_types.Message(
-            message_id=uuid.uuid4().hex,
+            message_id=secrets.token_hex(16),
             parts=[a2a_types.Part(root=a2a_types.TextPart(text=str(message)))],
             role=a2a_types.Role.agent,
         )
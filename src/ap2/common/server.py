@@ -15,15 +15,23 @@ from a2a.server.request_handlers.default_request_handler import DefaultRequestHa
 from a2a.server.tasks.inmemory_task_store import InMemoryTaskStore
 from a2a.types import AgentCard
 from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import uvicorn
 
 from ap2.common import watch_log
 from ap2.common.base_server_executor import BaseServerExecutor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses bytes directly and is several times faster than json; fall back
+# to the standard library when it is not installed.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 # Constant for the A2A extensions header
 A2A_EXTENSIONS_HEADER = "X-A2A-Extensions"
@@ -62,7 +70,7 @@ def run_agent_blocking(
 
     # Add a file handler to the logger for watch.log.
     logger = logging.getLogger(__name__)
-    logger.addHandler(watch_log.create_file_handler())
+    logger.addHandler(watch_log.get_queue_handler())
 
     # Build the Starlette app and add middlewares.
     app = _build_starlette_app(agent_card, executor=executor, rpc_url=rpc_url)
@@ -92,30 +100,31 @@ def _create_watch_log_handler() -> logging.FileHandler:
     return file_handler
 
 
-class _LoggingMiddleware(BaseHTTPMiddleware):
-    """Intercepts and logs incoming request and response details."""
-
-    def __init__(self, *args, logger: logging.Logger, **kwargs):
-        self._logger = logger
-        super().__init__(*args, **kwargs)
+class _LoggingMiddleware:
+    """Intercepts and logs incoming request and response details.
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        self._logger.info("\n\n\n")
-        self._logger.info("---------- New Agent Request Received---------")
+    This is a plain ASGI middleware rather than a BaseHTTPMiddleware: the
+    request and response bodies are observed as they pass through, so the
+    request is not run in a separate task and the response is not buffered and
+    rebuilt.
+    """
 
-        # Log the request method and URL.
-        self._logger.info("%s %s", request.method, request.url)
+    def __init__(self, app: ASGIApp, *, logger: logging.Logger):
+        self._app = app
+        self._logger = logger
 
-        # Log the request body if it's present.
-        content_length = request.headers.get("content-length")
-        if content_length and int(content_length) > 0:
-            request_body = await request.json()
-        else:
-            request_body = "<empty>"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._logger.isEnabledFor(logging.INFO):
+            await self._app(scope, receive, send)
+            return
 
-        self._logger.info("\n")
-        self._logger.info("[Request Body]")
-        self._logger.info("%s", request_body)
+        request = Request(scope)
+        # Log the start of the request, with its method and URL.
+        self._logger.info(
+            "\n\n\n\n---------- New Agent Request Received---------\n%s %s",
+            request.method,
+            request.url,
+        )
 
         # If the extension header is present, log a notice.
         extension_header = request.headers.get(A2A_EXTENSIONS_HEADER)
@@ -124,38 +133,79 @@ class _LoggingMiddleware(BaseHTTPMiddleware):
                 "\n[Extension Header]\n%s: %s", A2A_EXTENSIONS_HEADER, extension_header
             )
 
-        response = await call_next(request)
+        # Log the request body once the app has read all of it. If the app
+        # responds without doing so, log whatever it did read when the response
+        # starts, so that every request gets a body stanza.
+        request_body = bytearray()
+        content_length = request.headers.get("content-length")
+        body_pending = bool(
+            (content_length and int(content_length) > 0)
+            or "transfer-encoding" in request.headers
+        )
+        if not body_pending:
+            self._log_request_body(None)
+
+        def log_pending_body(complete: bool) -> None:
+            nonlocal body_pending
+            if body_pending:
+                body_pending = False
+                self._log_request_body(bytes(request_body), complete=complete)
+
+        async def logging_receive() -> Message:
+            message = await receive()
+            if body_pending and message["type"] == "http.request":
+                request_body.extend(message.get("body", b""))
+                if not message.get("more_body", False):
+                    log_pending_body(complete=True)
+            return message
+
+        response_body = bytearray()
+
+        async def logging_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                log_pending_body(complete=False)
+            elif message["type"] == "http.response.body":
+                response_body.extend(message.get("body", b""))
+                if not message.get("more_body", False):
+                    self._log_response(bytes(response_body))
+            await send(message)
+
+        try:
+            await self._app(scope, logging_receive, logging_send)
+        finally:
+            log_pending_body(complete=False)
+
+    def _log_request_body(self, body: bytes | None, *, complete: bool = True) -> None:
+        """Logs the request body, or the part of it that the app read."""
+        if not body:
+            request_body = "<empty>" if complete else "<not read>"
+        elif complete and self._logger.isEnabledFor(logging.DEBUG):
+            # The raw body is logged as-is; it is only parsed as JSON when
+            # debugging, and logged as text if it is not valid JSON.
+            try:
+                request_body = _json_loads(body)
+            except ValueError:
+                request_body = body.decode("utf-8", errors="replace")
+        else:
+            request_body = body.decode("utf-8", errors="replace")
+            if not complete:
+                request_body += "\n<the rest was not read>"
 
-        # Ensure the response has a body to read.
-        if response.body_iterator:
-            body = b""
+        self._logger.info("\n\n[Request Body]\n%s", request_body)
 
-            # Read the entire response body.
+    def _log_response(self, body: bytes) -> None:
+        """Logs the response body."""
+        if not body:
+            response_body_json = "<empty>"
+        else:
             # All responses are UTF-8 encoded JSON, so this should always succeed.
-            async for chunk in response.body_iterator:
-                body += chunk
-
             try:
                 response_body_json = body.decode("utf-8")
             except UnicodeDecodeError:
                 self._logger.warning("Failed to decode response body as UTF-8.")
                 response_body_json = body
 
-            self._logger.info("\n")
-            self._logger.info("[Response Body]")
-            self._logger.info("%s", response_body_json)
-
-            return Response(
-                content=body,
-                status_code=response.status_code,
-                media_type=response.media_type,
-                headers=response.headers,
-            )
-        else:
-            self._logger.info("\n")
-            self._logger.info("[Response Body]")
-            self._logger.info("<empty>")
-            return response
+        self._logger.info("\n\n[Response Body]\n%s", response_body_json)
 
 
 def _build_starlette_app(
@@ -195,23 +245,9 @@ def _add_middlewares(app, logger: logging.Logger) -> None:
     """Add middlewares to the Starlette app."""
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "http://localhost:8000",
-            "http://127.0.0.1:8000",
-            "http://0.0.0.0:8000",
-            "http://localhost:8081",
-            "http://127.0.0.1:8081",
-            "http://0.0.0.0:8081",
-            "http://localhost:8082",
-            "http://127.0.0.1:8082",
-            "http://0.0.0.0:8082",
-            "http://localhost:8083",
-            "http://127.0.0.1:8083",
-            "http://0.0.0.0:8083",
-            "http://localhost:8080",
-            "http://127.0.0.1:8080",
-            "http://0.0.0.0:8080",
-        ],
+        allow_origin_regex=(
+            r"^http://(localhost|127\.0\.0\.1|0\.0\.0\.0):(8000|8080|8081|8082|8083)$"
+        ),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -23,3 +23,22 @@ def validate_payment_mandate_signature(payment_mandate: PaymentMandate) -> None:
     logging.info("Valid PaymentMandate found.")
 
 
+def validate_payment_mandate_signature_raw(raw: bytes | str) -> PaymentMandate:
+    """Decodes a JSON-encoded PaymentMandate and validates its signature.
+
+    The JSON is parsed and validated in a single pass by pydantic-core, without
+    first decoding it into Python dicts.
+
+    Args:
+      raw: The JSON encoding of the PaymentMandate.
+
+    Returns:
+      The decoded PaymentMandate.
+
+    Raises:
+      pydantic.ValidationError: If raw is not a valid PaymentMandate.
+      ValueError: If the PaymentMandate signature is not valid.
+    """
+    payment_mandate = PaymentMandate.model_validate_json(raw)
+    validate_payment_mandate_signature(payment_mandate)
+    return payment_mandate
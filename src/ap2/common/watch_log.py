@@ -6,29 +6,211 @@ that are sent to/from the client, so engineers can see what is happening
 between the servers in real time.
 """
 
+import atexit
+import itertools
+import json
 import logging
-from typing import Any
+import logging.handlers
+import os
+import queue
+from typing import Any, TYPE_CHECKING
 
-from a2a.server.agent_execution.context import RequestContext
+from pydantic import BaseModel
 
 from ap2.types.mandate import CART_MANDATE_DATA_KEY
 from ap2.types.mandate import INTENT_MANDATE_DATA_KEY
 from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from a2a.server.agent_execution.context import RequestContext
+
 
 _logger = logging.getLogger(__name__)
 
+_INFO = logging.INFO
+
+_LOG_DIR = ".logs"
+
+_FORMATTER = logging.Formatter("%(message)s")
+
+# The watch.log label for each mandate type that may appear in a data part.
+_MANDATE_LABELS = {
+    CART_MANDATE_DATA_KEY: "[A Cart Mandate was in the request Data]",
+    INTENT_MANDATE_DATA_KEY: "[An Intent Mandate was in the request Data]",
+    PAYMENT_MANDATE_DATA_KEY: "[A Payment Mandate was in the request Data]",
+}
+
+_handler: "_WatchLogFileHandler | None" = None
+_queue_handler: logging.handlers.QueueHandler | None = None
+
+# Records are formatted into a reusable buffer of this many bytes, which is
+# written to watch.log once it is full, even if more records are queued.
+_WRITE_BUFFER_SIZE = 8192
+
+# A buffer that grew past this many bytes is replaced once it is written out,
+# so a single burst of large records does not pin the memory.
+_MAX_RETAINED_BUFFER_SIZE = 128 * 1024
+
+
+class _WatchLogFileHandler(logging.FileHandler):
+    """A FileHandler that writes records out in batches.
+
+    Formatted records are copied into a reusable bytearray, which is handed to
+    the kernel in a single os.write. When records are fed from a queue (see
+    set_source_queue), the write is held back while more records are waiting,
+    so a burst of records costs one write; otherwise each record is written as
+    it is emitted. The buffer is always written once it holds
+    _WRITE_BUFFER_SIZE bytes, when a WARNING or worse is logged, and on
+    flush(). The file itself is not opened until the first write.
+    """
+
+    def __init__(self, filename: str):
+        super().__init__(filename, encoding="utf-8", delay=True)
+        self._buffer = bytearray(_WRITE_BUFFER_SIZE)
+        self._used = 0
+        self._source_queue: queue.SimpleQueue | None = None
+
+    def set_source_queue(self, source_queue: queue.SimpleQueue) -> None:
+        """Sets the queue whose records are passed on to this handler."""
+        self._source_queue = source_queue
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = (self.format(record) + self.terminator).encode("utf-8")
+            end = self._used + len(data)
+            # Overwrites the unused tail in place, growing the buffer if needed.
+            self._buffer[self._used:end] = data
+            self._used = end
+            if (
+                end >= _WRITE_BUFFER_SIZE
+                or record.levelno >= logging.WARNING
+                or self._source_queue is None
+                or self._source_queue.empty()
+            ):
+                self._write()
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            self._write()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+    def _write(self) -> None:
+        if not self._used:
+            return
+        if self.stream is None:
+            self.stream = self._open()
+        _write_all(self.stream.fileno(), self._buffer, self._used)
+        self._used = 0
+        if len(self._buffer) > _MAX_RETAINED_BUFFER_SIZE:
+            self._buffer = bytearray(_WRITE_BUFFER_SIZE)
+
+
+def _write_all(fd: int, buffer: bytearray, size: int) -> None:
+    """Writes the first size bytes of the buffer to the file descriptor."""
+    view = memoryview(buffer)[:size]
+    while view:
+        view = view[os.write(fd, view):]
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """A QueueHandler that leaves formatting to the listener thread.
 
-def create_file_handler() -> logging.FileHandler:
-    """Creates a file handler to the logger for watch.log.
+    The stock QueueHandler formats each record before enqueueing it, so that it
+    could be sent to another process. The watch.log queue never leaves this
+    process, so records are enqueued as they are and formatted, _Json values
+    included, on the listener thread. Logged values are therefore read some
+    time after the logging call and must not be mutated after being logged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _Json:
+    """Renders a logged value as JSON, but only once the record is formatted."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any):
+        self._value = value
+
+    def __str__(self) -> str:
+        try:
+            if orjson is not None:
+                return orjson.dumps(self._value, default=_to_jsonable).decode()
+            return json.dumps(self._value, default=_to_jsonable)
+        except (TypeError, ValueError):
+            return str(self._value)
+
+
+def _to_jsonable(value: Any) -> Any:
+    """Converts values that JSON encoders do not natively support."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def create_file_handler() -> _WatchLogFileHandler:
+    """Returns the handler that writes to watch.log.
+
+    Records passed on from the queue of get_queue_handler are written in
+    batches, so a burst of records costs one write to the file instead of one
+    per record. The handler is created once and shared, so that records from
+    every logger using it stay in order.
 
     Returns:
       A logging.FileHandler instance configured for 'watch.log'.
     """
-    file_handler = logging.FileHandler(".logs/watch.log")
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(logging.Formatter("%(message)s"))
-    return file_handler
+    global _handler
+    if _handler is None:
+        # The file itself is only opened on the first write.
+        os.makedirs(_LOG_DIR, exist_ok=True)
+        _handler = _WatchLogFileHandler(os.path.join(_LOG_DIR, "watch.log"))
+        _handler.setLevel(_INFO)
+        _handler.setFormatter(_FORMATTER)
+        atexit.register(_handler.flush)
+    return _handler
+
+
+def get_queue_handler() -> logging.handlers.QueueHandler:
+    """Returns a handler that writes to watch.log from a background thread.
+
+    Logging through this handler only enqueues the record; a QueueListener
+    thread formats it and passes it on to the handler from create_file_handler.
+    This keeps formatting and file I/O off the request-handling path. The
+    handler is created once and shared, so that records from every logger using
+    it stay in order.
+
+    Returns:
+      A logging.handlers.QueueHandler instance feeding 'watch.log'.
+    """
+    global _queue_handler
+    if _queue_handler is None:
+        log_queue = queue.SimpleQueue()
+        file_handler = create_file_handler()
+        file_handler.set_source_queue(log_queue)
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        # Registered after the file handler's flush, so it runs first at exit.
+        atexit.register(listener.stop)
+        _queue_handler = _DeferredQueueHandler(log_queue)
+        # Every queued record must reach the file handler, which holds back its
+        # write while records are queued; a record it would discard could
+        # otherwise keep the one before it waiting.
+        _queue_handler.setLevel(_INFO)
+    return _queue_handler
 
 
 def log_a2a_message_parts(
@@ -38,67 +220,49 @@ def log_a2a_message_parts(
 
     """Logs the A2A message parts to the watch.log file."""
     _log_request_instructions(text_parts)
-    _log_mandates(data_parts)
-    _log_extra_data(data_parts)
+    _log_data_parts(data_parts)
 
 
-def log_a2a_request_extensions(context: RequestContext) -> None:
+def log_a2a_request_extensions(context: "RequestContext") -> None:
     """Logs the A2A extensions activated to the watch.log file."""
 
-    if not context.call_context.activated_extensions:
+    if (
+        not _logger.isEnabledFor(_INFO)
+        or not context.call_context.activated_extensions
+    ):
         return
 
-    _logger.info("\n")
-    _logger.info("[A2A Extensions Activated in the Request]")
-
-    for extension in context.call_context.requested_extensions:
-        _logger.info(extension)
+    _logger.info(
+        "\n\n[A2A Extensions Activated in the Request]%s",
+        "".join(
+            f"\n{extension}"
+            for extension in context.call_context.requested_extensions
+        ),
+    )
 
 
 def _load_logger():
     if not _logger.handlers:
-        _logger.addHandler(create_file_handler())
+        _logger.addHandler(get_queue_handler())
 
 
 def _log_request_instructions(text_parts: list[str]) -> None:
     """Logs the request instructions from the text parts."""
-    _logger.info("\n")
-    _logger.info("[Request Instructions]")
-    _logger.info(text_parts)
-
-
-def _log_mandates(data_parts: list[dict[str, Any]]) -> None:
-    """Extracts and logs mandates from the data parts."""
-
-    for data_part in data_parts:
-        for key, value in data_part.items():
-            if key == CART_MANDATE_DATA_KEY:
-                _logger.info("\n")
-                _logger.info("[A Cart Mandate was in the request Data]")
-                _logger.info(value)
-            elif key == INTENT_MANDATE_DATA_KEY:
-                _logger.info("\n")
-                _logger.info("[An Intent Mandate was in the request Data]")
-                _logger.info(value)
-            elif key == PAYMENT_MANDATE_DATA_KEY:
-                _logger.info("\n")
-                _logger.info("[A Payment Mandate was in the request Data]")
-                _logger.info(value)
-
-
-def _log_extra_data(data_parts: list[dict[str, Any]]) -> None:
-    """Extracts and logs extra data from the data parts."""
-    for data_part in data_parts:
-        for key, value in data_part.items():
-            if (
-                key == CART_MANDATE_DATA_KEY
-                or key == INTENT_MANDATE_DATA_KEY
-                or key == PAYMENT_MANDATE_DATA_KEY
-            ):
-                continue
-
-            _logger.info("\n")
-            _logger.info("[Data Part: %s] ", key)
-            _logger.info(value)
+    if not _logger.isEnabledFor(_INFO):
+        return
+    _logger.info("\n\n[Request Instructions]\n%s", text_parts)
 
 
+def _log_data_parts(data_parts: list[dict[str, Any]]) -> None:
+    """Logs the mandates and any extra data from the data parts."""
+    if not _logger.isEnabledFor(_INFO):
+        return
+    items = itertools.chain.from_iterable(
+        data_part.items() for data_part in data_parts
+    )
+    for key, value in items:
+        label = _MANDATE_LABELS.get(key)
+        if label is not None:
+            _logger.info("\n\n%s\n%s", label, _Json(value))
+        else:
+            _logger.info("\n\n[Data Part: %s] \n%s", key, _Json(value))
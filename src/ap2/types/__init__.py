@@ -11,3 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+
+from importlib import machinery as _importlib_machinery
+from importlib import util as _importlib_util
+
+# True when the models were built as compiled extension modules (see setup.py).
+COMPILED: bool = isinstance(
+    getattr(_importlib_util.find_spec("ap2.types.payment_request"), "loader", None),
+    _importlib_machinery.ExtensionFileLoader,
+)
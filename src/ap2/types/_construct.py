@@ -0,0 +1,76 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for building pydantic models from data.
+
+construct_canonical_object builds models from trusted data without validating
+it; get_validator gives the validator to use for everything else.
+"""
+
+import functools
+import types
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import SchemaValidator
+
+
+def construct_canonical_object(
+    canonical_object_model: type[BaseModel], data: dict[str, Any]
+) -> BaseModel:
+  """Builds a canonical object from trusted data without validating it.
+
+  Nested models, including those inside lists and optionals, are built the
+  same way, so the result has the same shape as a validated object. Only use
+  this for data that has already been validated upstream; no type coercion or
+  constraint checks are performed.
+
+  Args:
+    canonical_object_model: The pydantic model of the canonical object.
+    data: The already-validated field values of the object.
+
+  Returns:
+    The canonical object built from the data.
+  """
+  values = {
+      name: _construct_value(field.annotation, data[name])
+      for name, field in canonical_object_model.model_fields.items()
+      if name in data
+  }
+  return canonical_object_model.model_construct(**values)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+  """Builds nested models found in a trusted field value."""
+  if value is None:
+    return None
+  if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+    if isinstance(value, dict):
+      return construct_canonical_object(annotation, value)
+    return value
+  origin = get_origin(annotation)
+  if origin is list and isinstance(value, list):
+    (item_annotation,) = get_args(annotation) or (Any,)
+    return [_construct_value(item_annotation, item) for item in value]
+  if origin is Union or origin is types.UnionType:
+    for arg in get_args(annotation):
+      if arg is not type(None):
+        return _construct_value(arg, value)
+  return value
+
+
+@functools.cache
+def get_validator(model: type[BaseModel]) -> SchemaValidator:
+  """Returns the compiled pydantic-core validator for the model."""
+  return model.__pydantic_validator__
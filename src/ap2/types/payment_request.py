@@ -22,16 +22,60 @@ Specification:
 https://www.w3.org/TR/payment-request/
 """
 
-from typing import Any, Dict, Optional
+from decimal import Context
+from decimal import Decimal
+from decimal import ROUND_HALF_UP
+import math
+from typing import Any, ClassVar, Dict, Optional, TypeVar
 
+from ap2.types._construct import construct_canonical_object
 from ap2.types.contact_picker import ContactAddress
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
 PAYMENT_METHOD_DATA_DATA_KEY = "payment_request.PaymentMethodData"
 
+# ISO 4217 minor unit exponents for currencies that do not use two decimals.
+_ISO4217_EXPONENTS = {
+    "BHD": 3, "BIF": 0, "CLF": 4, "CLP": 0, "DJF": 0, "GNF": 0, "IQD": 3,
+    "ISK": 0, "JOD": 3, "JPY": 0, "KMF": 0, "KRW": 0, "KWD": 3, "LYD": 3,
+    "OMR": 3, "PYG": 0, "RWF": 0, "TND": 3, "UGX": 0, "UYI": 0, "UYW": 4,
+    "VND": 0, "VUV": 0, "XAF": 0, "XOF": 0, "XPF": 0,
+}
 
-class PaymentCurrencyAmount(BaseModel):
+# Precise enough to hold any finite float in minor units without rounding.
+_DECIMAL_CONTEXT = Context(prec=400, rounding=ROUND_HALF_UP)
+
+
+_ModelT = TypeVar("_ModelT", bound="_PaymentRequestModel")
+
+
+def _function() -> None:
+  """Never called; only its type is used, by _PaymentRequestModel."""
+
+
+class _PaymentRequestModel(BaseModel):
+  """Base class of the models in this module."""
+
+  # When this module is compiled with Cython (see setup.py), its functions are
+  # cyfunctions rather than plain Python functions. Pydantic would otherwise
+  # mistake methods of that type for fields without annotations.
+  model_config = ConfigDict(ignored_types=(type(_function),))
+
+  @classmethod
+  def trusted(cls: type[_ModelT], **kwargs: Any) -> _ModelT:
+    """Builds the model from trusted data, skipping validation.
+
+    Nested models, e.g. the amount of a PaymentItem, may be given as dicts and
+    are built the same way. Only use this for data whose shape the caller
+    guarantees, such as data this process validated before; incoming requests
+    should be validated as usual.
+    """
+    return construct_canonical_object(cls, kwargs)
+
+
+class PaymentCurrencyAmount(_PaymentRequestModel):
   """A PaymentCurrencyAmount is used to supply monetary amounts.
 
   Specification:
@@ -43,8 +87,42 @@ class PaymentCurrencyAmount(BaseModel):
   )
   value: float = Field(..., description="The monetary value.")
 
+  @property
+  def exponent(self) -> int:
+    """The number of decimal places of the currency's minor unit."""
+    return _ISO4217_EXPONENTS.get(self.currency.upper(), 2)
+
+  def as_decimal(self) -> Decimal:
+    """Returns the value as a Decimal with the currency's minor unit.
+
+    The value is taken as the shortest decimal that round-trips to the float,
+    so 19.99 becomes Decimal("19.99") rather than its binary approximation.
+    Values with more decimal places than the minor unit are rounded half away
+    from zero (ROUND_HALF_UP), e.g. USD 0.125 becomes 0.13 and JPY 1234.5
+    becomes 1235.
 
-class PaymentItem(BaseModel):
+    Raises:
+      ValueError: if the value is infinite or NaN.
+    """
+    if not math.isfinite(self.value):
+      raise ValueError(f"{self.value} {self.currency} is not a finite amount.")
+    return Decimal(repr(self.value)).quantize(
+        Decimal(1).scaleb(-self.exponent), context=_DECIMAL_CONTEXT
+    )
+
+  def minor_units(self) -> int:
+    """Returns the value as an integer count of minor units (e.g. cents).
+
+    The value is rounded as in as_decimal. Sums of minor units are exact,
+    unlike sums of the float values.
+
+    Raises:
+      ValueError: if the value is infinite or NaN.
+    """
+    return int(self.as_decimal().scaleb(self.exponent, _DECIMAL_CONTEXT))
+
+
+class PaymentItem(_PaymentRequestModel):
   """An item for purchase and the value asked for it.
 
   Specification:
@@ -65,7 +143,7 @@ class PaymentItem(BaseModel):
   )
 
 
-class PaymentShippingOption(BaseModel):
+class PaymentShippingOption(_PaymentRequestModel):
   """Describes a shipping option.
 
   Specification:
@@ -86,13 +164,20 @@ class PaymentShippingOption(BaseModel):
   )
 
 
-class PaymentOptions(BaseModel):
+class PaymentOptions(_PaymentRequestModel):
   """Information about the eligible payment options for the payment request.
 
+  PaymentOptions are immutable, so the all-defaults instance can be shared;
+  use PaymentOptions.default() rather than building a new one.
+
   Specification:
   https://www.w3.org/TR/payment-request/#dom-paymentoptions
   """
 
+  model_config = ConfigDict(frozen=True)
+
+  DEFAULT: ClassVar["PaymentOptions"]
+
   request_payer_name: Optional[bool] = Field(
       False, description="Indicates if the payer's name should be collected."
   )
@@ -113,8 +198,16 @@ class PaymentOptions(BaseModel):
       None, description="Can be `shipping`, `delivery`, or `pickup`."
   )
 
+  @classmethod
+  def default(cls) -> "PaymentOptions":
+    """Returns the shared PaymentOptions with every field at its default."""
+    return cls.DEFAULT
+
+
+PaymentOptions.DEFAULT = PaymentOptions()
 
-class PaymentMethodData(BaseModel):
+
+class PaymentMethodData(_PaymentRequestModel):
   """Indicates a payment method and associated data specific to the method.
 
   For example:
@@ -133,7 +226,7 @@ class PaymentMethodData(BaseModel):
   )
 
 
-class PaymentDetailsModifier(BaseModel):
+class PaymentDetailsModifier(_PaymentRequestModel):
   """Provides details that modify the payment details based on a payment method.
 
   Specification:
@@ -157,7 +250,7 @@ class PaymentDetailsModifier(BaseModel):
   )
 
 
-class PaymentDetailsInit(BaseModel):
+class PaymentDetailsInit(_PaymentRequestModel):
   """Contains the details of the payment being requested.
 
   Specification:
@@ -180,8 +273,16 @@ class PaymentDetailsInit(BaseModel):
   )
   total: PaymentItem = Field(..., description="The total payment amount.")
 
+  def display_items_total(self) -> float:
+    """Returns the sum of the display item amounts.
+
+    The sum is computed with math.fsum, so it does not accumulate rounding
+    error across large carts. It can be compared against total.amount.value.
+    """
+    return math.fsum(item.amount.value for item in self.display_items)
+
 
-class PaymentRequest(BaseModel):
+class PaymentRequest(_PaymentRequestModel):
   """A request for payment.
 
   Specification:
@@ -201,7 +302,7 @@ class PaymentRequest(BaseModel):
   )
 
 
-class PaymentResponse(BaseModel):
+class PaymentResponse(_PaymentRequestModel):
   """Indicates a user has chosen a payment method & approved a payment request.
 
   Specification: